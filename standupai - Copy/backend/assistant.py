@@ -1,23 +1,34 @@
 import os
 import sys
 import asyncio
+import dataclasses
+import functools
 import logging
+import uuid
 from dotenv import load_dotenv
-from datetime import datetime
-from typing import Dict, List, Optional
-import json
-import requests
-from flask import Flask, jsonify, request
-from flask_cors import CORS
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+import aiofiles
+import orjson
+from quart import Quart, jsonify, request
+from quart_cors import cors
+from hypercorn.asyncio import serve
+from hypercorn.config import Config as HypercornConfig
 import threading
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import TTLCache
 
 # MongoDB imports with error handling
 try:
-    from pymongo import MongoClient
+    from pymongo import AsyncMongoClient, UpdateOne
+    from pymongo.collation import Collation, CollationStrength
     from pymongo.errors import ConnectionFailure, OperationFailure, ConfigurationError, ServerSelectionTimeoutError
     MONGODB_AVAILABLE = True
+    # Case-insensitive name matching, backed by the "name_ci" index
+    NAME_COLLATION = Collation(locale="en", strength=CollationStrength.SECONDARY)
 except ImportError:
     MONGODB_AVAILABLE = False
+    NAME_COLLATION = None
     logging.warning("PyMongo not installed. MongoDB features will be disabled.")
 
 from livekit import agents, rtc
@@ -32,9 +43,6 @@ from livekit.agents import (
     cli,
 )
 
-from livekit.plugins import openai, silero, noise_cancellation
-from livekit.plugins.turn_detector.multilingual import MultilingualModel
-
 # Load environment variables from .env
 load_dotenv()
 
@@ -42,14 +50,70 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("neha_ai_agent")
 
+# libuv-backed event loop. Set at import time, not in __main__, because
+# LiveKit's job processes only import this module and build their loops later
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    logger.info("uvloop not installed, using the default asyncio event loop")
+
 # Global variables for meeting management
 ROOM_NAME = "daily-standup-room"
 MEETING_LINK = None
 MEETING_STATUS = "inactive"
 
-# Flask app for API endpoints
-app = Flask(__name__)
-CORS(app)
+# Seconds between background MongoDB health checks
+HEALTH_CHECK_INTERVAL = 60
+
+# Stand-up logs kept per participant (oldest are dropped first)
+MAX_LOG_ENTRIES = 20
+
+# Stand-up answers recorded by the save_session_data tool
+SESSION_FIELDS = ("yesterdayWork", "todayPlan", "blockers", "sprintStatus")
+
+# LiveKit credentials, read once at startup
+LIVEKIT_API_KEY = os.getenv("LIVEKIT_API_KEY")
+LIVEKIT_API_SECRET = os.getenv("LIVEKIT_API_SECRET")
+LIVEKIT_URL = os.getenv("LIVEKIT_URL")
+
+# Signed tokens keyed by (participant, room); expires well before the token's own TTL
+TOKEN_CACHE = TTLCache(maxsize=1024, ttl=600)
+
+# System prompt shared by every agent session
+INSTRUCTIONS = """
+You are NEHA Shah, a senior AI Scrum Master facilitating daily stand-up meetings.
+
+🎯 **YOUR BEHAVIOR:**
+- When someone joins, greet them warmly and check if you know them from the database
+- If you know them, reference their previous work and project
+- If you don't know them, welcome them as a new team member
+- Ask the standard stand-up questions naturally
+- Be conversational and human-like
+
+💬 **GREETING FLOW:**
+1. When someone joins: "Good morning! I'm NEHA, your AI Scrum Master."
+2. Check if you know them: "Let me check... [pause] Welcome back [Name]! I see you're working on [Project]."
+3. Reference history: "Last time you mentioned [previous work/blockers]."
+4. Start questions: "Let's start today's stand-up. What did you work on yesterday?"
+
+📌 **STAND-UP QUESTIONS:**
+1. "What did you work on yesterday?"
+2. "What are you planning to work on today?"
+3. "Are there any blockers or impediments?"
+4. "How are you feeling about your sprint goals?"
+
+🚫 **DO NOT:**
+- Ask for their name (you can detect it automatically)
+- Reveal you're an AI
+- Make the meeting too long
+
+Use the lookup_participant and save_session_data functions as needed.
+"""
+
+# Quart app for API endpoints
+app = Quart(__name__)
+app = cors(app)
 
 class MongoDBManager:
     """Simplified MongoDB manager"""
@@ -59,10 +123,16 @@ class MongoDBManager:
         self.db = None
         self.participants_collection = None
         self.connected = False
+        # Participant documents keyed by normalized name
+        self._cache = TTLCache(maxsize=512, ttl=300)
+        self._index_ready = False
+        # Result of the last ping (``connected`` starts out optimistic)
+        self._ping_ok = False
+        self._health_task = None
         self.connect()
     
     def connect(self):
-        """Establish MongoDB connection"""
+        """Create the MongoDB client (connections are opened lazily by the driver)"""
         if not MONGODB_AVAILABLE:
             logger.warning("MongoDB not available")
             return
@@ -73,97 +143,276 @@ class MongoDBManager:
                 logger.warning("MONGODB_URI not set")
                 return
             
-            self.client = MongoClient(mongo_uri, serverSelectionTimeoutMS=5000)
-            self.client.admin.command('ping')
-            
+            self.client = AsyncMongoClient(
+                mongo_uri,
+                maxPoolSize=50,
+                minPoolSize=5,
+                maxIdleTimeMS=300000,
+                waitQueueTimeoutMS=2000,
+                serverSelectionTimeoutMS=5000,
+                retryWrites=True,
+            )
             self.db = self.client["standup_db"]
             self.participants_collection = self.db["participants"]
+            # Assume reachable; the background health check corrects this
             self.connected = True
             
-            logger.info("✅ Connected to MongoDB")
-            
         except Exception as e:
             logger.error(f"❌ MongoDB connection failed: {e}")
             self.connected = False
     
+    def start_health_check(self):
+        """Start pinging MongoDB in the background on the running event loop"""
+        if self.client is None or self._health_task is not None:
+            return
+        self._health_task = asyncio.create_task(self._background_ping())
+    
+    async def _background_ping(self):
+        """Ping periodically and keep ``connected`` up to date"""
+        while True:
+            await self.ping()
+            await asyncio.sleep(HEALTH_CHECK_INTERVAL)
+    
+    async def ping(self) -> bool:
+        """Check the connection and make sure the name index exists"""
+        if self.client is None:
+            return False
+            
+        try:
+            await self.client.admin.command('ping')
+        except Exception as e:
+            if self.connected:
+                logger.error(f"❌ MongoDB connection failed: {e}")
+            self.connected = False
+            self._ping_ok = False
+            return False
+            
+        if not self._ping_ok:
+            logger.info("✅ Connected to MongoDB")
+        self.connected = True
+        self._ping_ok = True
+        
+        # Done after the state update so index problems never affect ``connected``
+        if not self._index_ready:
+            await self._ensure_name_index()
+        return True
+    
+    async def _ensure_name_index(self):
+        """Create the case-insensitive name index; lookups still work without it"""
+        try:
+            await self.participants_collection.create_index(
+                [("name", 1)], collation=NAME_COLLATION, name="name_ci"
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ Could not create the name_ci index, name lookups will not use it: {e}")
+        # Not retried: the usual failures (conflicting index, missing privilege) are permanent
+        self._index_ready = True
+    
+    async def close(self):
+        """Stop the health check and close the client"""
+        if self._health_task is not None:
+            self._health_task.cancel()
+            self._health_task = None
+        if self.client is not None:
+            await self.client.close()
+        self.connected = False
+    
     def is_connected(self) -> bool:
         return self.connected and self.client is not None
     
-    def get_participant_data(self, participant_name: str) -> Optional[Dict]:
+    async def get_participant_data(self, participant_name: str) -> Optional[Dict]:
         """Get participant data with debug info"""
         if not self.is_connected():
             logger.warning("MongoDB not connected")
             return None
             
+        key = self._cache_key(participant_name)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+            
         try:
-            print(f"\n🔍 SEARCHING FOR: '{participant_name}'")
-            
-            # Get all participants for comparison
-            all_participants = list(self.participants_collection.find({}, {"name": 1, "project": 1}))
-            print(f"📋 DATABASE HAS {len(all_participants)} PARTICIPANTS:")
-            for i, p in enumerate(all_participants, 1):
-                name = p.get('name', 'NO_NAME')
-                project = p.get('project', 'NO_PROJECT')
-                print(f"   {i}. '{name}' - {project}")
-            
-            # Try exact match
-            result = self.participants_collection.find_one({"name": participant_name})
-            if result:
-                print(f"✅ EXACT MATCH FOUND: {result['name']}")
-                return result
+            logger.debug("🔍 Searching for participant name=%r", participant_name)
             
-            # Try case-insensitive
-            result = self.participants_collection.find_one({
-                "name": {"$regex": f"^{participant_name}$", "$options": "i"}
-            })
+            # Only the latest log is needed by callers
+            result = await self.participants_collection.find_one(
+                {"name": participant_name},
+                {"logs": {"$slice": -1}},
+                collation=NAME_COLLATION
+            )
             if result:
-                print(f"✅ CASE-INSENSITIVE MATCH: {result['name']}")
+                logger.debug("✅ Match found name=%r", result['name'])
+                self._cache[key] = result
                 return result
             
-            print(f"❌ NO MATCH FOUND FOR: '{participant_name}'")
+            logger.debug("❌ No match found name=%r", participant_name)
             return None
             
         except Exception as e:
             logger.error(f"❌ Database query error: {e}")
             return None
 
-    def update_participant_data(self, participant_name: str, session_data: Dict) -> bool:
-        """Update participant data"""
+    async def record_session_field(self, participant_name: str, session_id: str, data_type: str, content: str) -> bool:
+        """Atomically write one stand-up answer into the participant's current session"""
         if not self.is_connected():
             return False
             
+        if data_type == "blockers":
+            value = {"$concatArrays": [
+                {"$ifNull": ["$currentSession.blockers", []]},
+                [{"$literal": content}]
+            ]}
+        else:
+            value = {"$literal": content}
+            
         try:
-            result = self.participants_collection.update_one(
-                {"name": {"$regex": f"^{participant_name}$", "$options": "i"}},
-                {
-                    "$set": {
-                        "name": participant_name,
-                        "lastSession": datetime.now(),
-                        "project": session_data.get("project", ""),
-                        "role": session_data.get("role", "")
-                    },
-                    "$push": {
-                        "logs": {
-                            "timestamp": datetime.now(),
-                            "yesterdayWork": session_data.get("yesterdayWork", ""),
-                            "todayPlan": session_data.get("todayPlan", ""),
-                            "blockers": session_data.get("blockers", []),
-                            "sprintStatus": session_data.get("sprintStatus", ""),
-                        }
-                    }
-                },
-                upsert=True
+            await self.participants_collection.update_one(
+                {"name": participant_name},
+                [
+                    self._claim_session_stage(session_id),
+                    {"$set": {f"currentSession.{data_type}": value, "lastSession": "$$NOW"}}
+                ],
+                upsert=True,
+                collation=NAME_COLLATION
             )
-            logger.info(f"✅ Updated data for: {participant_name}")
             return True
         except Exception as e:
-            logger.error(f"❌ Update failed: {e}")
+            logger.error(f"❌ Session write failed: {e}")
             return False
 
+    async def bulk_update(self, items: List[Tuple[str, Dict]], session_id: str) -> bool:
+        """Log each participant's finished session in a single bulk write"""
+        if not self.is_connected():
+            return False
+        if not items:
+            return True
+            
+        try:
+            ops = [
+                UpdateOne(
+                    {"name": participant_name},
+                    self._build_update(session_id, session_data),
+                    upsert=True,
+                    collation=NAME_COLLATION
+                )
+                for participant_name, session_data in items
+            ]
+            await self.participants_collection.bulk_write(ops, ordered=False)
+            for participant_name, _ in items:
+                self._cache.pop(self._cache_key(participant_name), None)
+            logger.info(f"✅ Updated data for {len(items)} participants")
+            return True
+        except Exception as e:
+            logger.error(f"❌ Bulk update failed: {e}")
+            return False
+
+    @staticmethod
+    def _cache_key(participant_name: str) -> str:
+        """Cache key for a participant name, ignoring case and surrounding whitespace"""
+        return participant_name.strip().lower()
+
+    @staticmethod
+    def _claim_session_stage(session_id: str) -> Dict:
+        """Pipeline stage that makes ``currentSession`` belong to ``session_id``
+
+        A ``currentSession`` left behind by another meeting (e.g. one that
+        crashed before exit) is first moved into the capped logs, stamped with
+        the time that meeting started.
+        """
+        is_ours = {"$eq": ["$currentSession.sessionId", {"$literal": session_id}]}
+        is_stale = {"$and": [{"$gt": ["$currentSession", None]}, {"$not": [is_ours]}]}
+        stale_entry = {
+            "timestamp": {"$ifNull": ["$currentSession.startedAt", "$$NOW"]},
+            "yesterdayWork": {"$ifNull": ["$currentSession.yesterdayWork", ""]},
+            "todayPlan": {"$ifNull": ["$currentSession.todayPlan", ""]},
+            "blockers": {"$ifNull": ["$currentSession.blockers", []]},
+            "sprintStatus": {"$ifNull": ["$currentSession.sprintStatus", ""]},
+        }
+        return {"$set": {
+            "logs": {"$cond": [
+                is_stale,
+                {"$slice": [
+                    {"$concatArrays": [{"$ifNull": ["$logs", []]}, [stale_entry]]},
+                    -MAX_LOG_ENTRIES
+                ]},
+                "$logs"
+            ]},
+            "currentSession": {"$cond": [
+                is_ours,
+                "$currentSession",
+                {"sessionId": {"$literal": session_id}, "startedAt": "$$NOW"}
+            ]}
+        }}
+
+    @staticmethod
+    def _build_update(session_id: str, session_data: Dict) -> List[Dict]:
+        """Build the update pipeline that logs one participant's finished session"""
+        now = datetime.now(timezone.utc)
+        log_entry = {
+            "timestamp": now,
+            "yesterdayWork": session_data.get("yesterdayWork", ""),
+            "todayPlan": session_data.get("todayPlan", ""),
+            "blockers": session_data.get("blockers", []),
+            "sprintStatus": session_data.get("sprintStatus", ""),
+        }
+        return [
+            MongoDBManager._claim_session_stage(session_id),
+            {"$set": {
+                "lastSession": now,
+                "logs": {"$slice": [
+                    {"$concatArrays": [{"$ifNull": ["$logs", []]}, [{"$literal": log_entry}]]},
+                    -MAX_LOG_ENTRIES
+                ]}
+            }},
+            # The in-memory session is complete, so the incremental copy is done
+            {"$unset": "currentSession"}
+        ]
+
+
+# An AsyncMongoClient is bound to the first event loop that uses it, and the
+# API server and agent jobs (threads in console mode / on Windows) each have
+# their own loop, so managers are shared per loop rather than per process
+_MONGODB_MANAGERS: Dict[asyncio.AbstractEventLoop, MongoDBManager] = {}
+
+
+def get_mongodb() -> MongoDBManager:
+    """Shared MongoDB manager for the running event loop"""
+    loop = asyncio.get_running_loop()
+    manager = _MONGODB_MANAGERS.get(loop)
+    if manager is None:
+        manager = _MONGODB_MANAGERS[loop] = MongoDBManager()
+    return manager
+
+
+async def release_mongodb():
+    """Close the running event loop's MongoDB manager, e.g. when a job ends"""
+    manager = _MONGODB_MANAGERS.pop(asyncio.get_running_loop(), None)
+    if manager:
+        await manager.close()
+
+
+@functools.lru_cache()
+def get_video_grants_template():
+    """Room-independent grants shared by every participant token"""
+    # Import LiveKit JWT here to avoid conflicts
+    from livekit import api
+    
+    return api.VideoGrants(
+        room_join=True,
+        can_publish=True,
+        can_subscribe=True,
+    )
+
+
+# Quart API routes
+@app.before_serving
+async def connect_mongodb():
+    """Health-check the shared MongoDB client on the API server's event loop"""
+    get_mongodb().start_health_check()
+
 
-# Flask API routes
 @app.route('/api/meeting-info', methods=['GET'])
-def get_meeting_info():
+async def get_meeting_info():
     """Get current meeting information"""
     global MEETING_LINK, MEETING_STATUS, ROOM_NAME
     
@@ -175,20 +424,19 @@ def get_meeting_info():
     })
 
 @app.route('/api/validate-participant', methods=['POST'])
-def validate_participant():
+async def validate_participant():
     """Validate participant against database"""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         participant_name = data.get('name', '').strip()
         
         if not participant_name:
             return jsonify({"valid": False, "message": "Name is required"}), 400
         
-        # Create MongoDB manager for validation
-        mongodb = MongoDBManager()
+        mongodb = get_mongodb()
         
         if mongodb.is_connected():
-            participant_data = mongodb.get_participant_data(participant_name)
+            participant_data = await mongodb.get_participant_data(participant_name)
             
             if participant_data:
                 return jsonify({
@@ -229,39 +477,39 @@ def validate_participant():
         return jsonify({"valid": False, "message": "Validation failed"}), 500
 
 @app.route('/api/generate-token', methods=['POST'])
-def generate_token():
+async def generate_token():
     """Generate LiveKit token for participant"""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         participant_name = data.get('name', '').strip()
         room_name = data.get('roomName', ROOM_NAME)
         
         if not participant_name:
             return jsonify({"error": "Name is required"}), 400
         
-        # Import LiveKit JWT here to avoid conflicts
-        from livekit import api
-        
-        # Create token
-        token = api.AccessToken(
-            api_key=os.getenv("LIVEKIT_API_KEY"),
-            api_secret=os.getenv("LIVEKIT_API_SECRET")
-        )
-        
-        token.with_identity(participant_name)
-        token.with_name(participant_name)
-        token.with_grants(api.VideoGrants(
-            room_join=True,
-            room=room_name,
-            can_publish=True,
-            can_subscribe=True,
-        ))
+        cache_key = (participant_name, room_name)
+        jwt_token = TOKEN_CACHE.get(cache_key)
         
-        jwt_token = token.to_jwt()
+        if jwt_token is None:
+            # Import LiveKit JWT here to avoid conflicts
+            from livekit import api
+            
+            # Create token
+            token = api.AccessToken(
+                api_key=LIVEKIT_API_KEY,
+                api_secret=LIVEKIT_API_SECRET
+            )
+            
+            token.with_identity(participant_name)
+            token.with_name(participant_name)
+            token.with_grants(dataclasses.replace(get_video_grants_template(), room=room_name))
+            
+            jwt_token = token.to_jwt()
+            TOKEN_CACHE[cache_key] = jwt_token
         
         return jsonify({
             "token": jwt_token,
-            "url": os.getenv("LIVEKIT_URL"),
+            "url": LIVEKIT_URL,
             "roomName": room_name,
             "participantName": participant_name
         })
@@ -297,7 +545,14 @@ def generate_meeting_link():
         return None
 
 
-def save_meeting_info():
+async def write_json_file(filename: str, data: Dict):
+    """Write data to a JSON file without blocking the event loop"""
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    async with aiofiles.open(filename, "wb") as f:
+        await f.write(payload)
+
+
+async def save_meeting_info():
     """Save meeting information to a file for frontend access"""
     meeting_info = {
         "roomName": ROOM_NAME,
@@ -308,29 +563,41 @@ def save_meeting_info():
     }
     
     try:
-        with open("meeting_info.json", "w") as f:
-            json.dump(meeting_info, f, indent=2)
+        await write_json_file("meeting_info.json", meeting_info)
         logger.info("📄 Meeting info saved to meeting_info.json")
     except Exception as e:
         logger.error(f"❌ Failed to save meeting info: {e}")
 
 
-def start_flask_server():
-    """Start Flask server in a separate thread"""
+def start_api_server():
+    """Serve the Quart API with hypercorn on its own event loop"""
     try:
         port = int(os.getenv("FLASK_PORT", 5000))
-        app.run(host='0.0.0.0', port=port, debug=False, use_reloader=False)
+        config = HypercornConfig()
+        config.bind = [f"0.0.0.0:{port}"]
+        config.keep_alive_timeout = 75
+        # Signal handlers can only be installed on the main thread, so hand
+        # the server a shutdown trigger that never fires; the daemon thread
+        # exits together with the agent process.
+        asyncio.run(serve(app, config, shutdown_trigger=lambda: asyncio.Future()))
     except Exception as e:
-        logger.error(f"❌ Flask server error: {e}")
+        logger.error(f"❌ API server error: {e}")
 
 
 def prewarm_fnc(proc: JobProcess):
     """Prewarm models"""
+    from livekit.plugins import openai, silero
+    
     try:
-        proc.userdata["vad"] = silero.VAD.load()
-        proc.userdata["stt"] = openai.STT(model="whisper-1")
-        proc.userdata["tts"] = openai.TTS(voice="nova")
-        proc.userdata["mongodb"] = MongoDBManager()
+        # Independent components, so load them side by side
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = {
+                "vad": executor.submit(silero.VAD.load),
+                "stt": executor.submit(openai.STT, model="whisper-1"),
+                "tts": executor.submit(openai.TTS, voice="nova"),
+                "llm": executor.submit(openai.LLM, model="gpt-4o-mini"),
+            }
+            proc.userdata.update({key: future.result() for key, future in futures.items()})
         logger.info("✅ Prewarming complete")
     except Exception as e:
         logger.error(f"❌ Prewarming failed: {e}")
@@ -339,46 +606,24 @@ def prewarm_fnc(proc: JobProcess):
 
 class NEHAAIAgent(Agent):
     def __init__(self, ctx: JobContext) -> None:
-        self.mongodb = ctx.proc.userdata.get("mongodb")
+        self.mongodb = get_mongodb()
         self.participants_in_room = {}
         self.session_data = {}
         self.ctx = ctx
-        
-        instructions = """
-You are NEHA Shah, a senior AI Scrum Master facilitating daily stand-up meetings.
-
-🎯 **YOUR BEHAVIOR:**
-- When someone joins, greet them warmly and check if you know them from the database
-- If you know them, reference their previous work and project
-- If you don't know them, welcome them as a new team member
-- Ask the standard stand-up questions naturally
-- Be conversational and human-like
-
-💬 **GREETING FLOW:**
-1. When someone joins: "Good morning! I'm NEHA, your AI Scrum Master."
-2. Check if you know them: "Let me check... [pause] Welcome back [Name]! I see you're working on [Project]."
-3. Reference history: "Last time you mentioned [previous work/blockers]."
-4. Start questions: "Let's start today's stand-up. What did you work on yesterday?"
-
-📌 **STAND-UP QUESTIONS:**
-1. "What did you work on yesterday?"
-2. "What are you planning to work on today?"
-3. "Are there any blockers or impediments?"
-4. "How are you feeling about your sprint goals?"
-
-🚫 **DO NOT:**
-- Ask for their name (you can detect it automatically)
-- Reveal you're an AI
-- Make the meeting too long
-
-Use the lookup_participant and save_session_data functions as needed.
-"""
+        # Tags this meeting's incremental writes in each participant's document
+        self.session_id = uuid.uuid4().hex
+        # Lookups currently running and finished lookup responses, by name
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._lookup_responses: Dict[str, str] = {}
+        # Latest fire-and-forget session write per participant; each write waits
+        # for the previous one so upserts and corrections apply in order
+        self._pending_writes: Dict[str, asyncio.Task] = {}
 
         try:
             super().__init__(
-                instructions=instructions,
+                instructions=INSTRUCTIONS,
                 stt=ctx.proc.userdata["stt"],
-                llm=openai.LLM(model="gpt-4o-mini"),
+                llm=ctx.proc.userdata["llm"],
                 tts=ctx.proc.userdata["tts"],
                 vad=ctx.proc.userdata["vad"]
             )
@@ -392,12 +637,26 @@ Use the lookup_participant and save_session_data functions as needed.
         description="Look up a participant in the database to get their history"
     )
     async def lookup_participant(self, participant_name: str) -> str:
-        """Look up participant data"""
+        """Look up participant data, sharing the result with concurrent callers"""
+        if participant_name in self._lookup_responses:
+            return self._lookup_responses[participant_name]
+        
+        # The fetch runs as its own task so a cancelled caller (e.g. an
+        # interrupted tool call) does not take the other callers down with it
+        task = self._inflight.get(participant_name)
+        if task is None:
+            task = asyncio.create_task(self._fetch_participant(participant_name))
+            self._inflight[participant_name] = task
+            task.add_done_callback(lambda _: self._inflight.pop(participant_name, None))
+        return await asyncio.shield(task)
+
+    async def _fetch_participant(self, participant_name: str) -> str:
+        """Query the database and build the lookup response"""
         try:
-            print(f"\n🔍 AGENT LOOKUP: '{participant_name}'")
+            logger.debug("🔍 Agent lookup name=%r", participant_name)
             
             if self.mongodb and self.mongodb.is_connected():
-                data = self.mongodb.get_participant_data(participant_name)
+                data = await self.mongodb.get_participant_data(participant_name)
                 
                 if data:
                     project = data.get('project', '')
@@ -423,9 +682,12 @@ Use the lookup_participant and save_session_data functions as needed.
                         if last_blockers:
                             response += f"Previous blockers: {', '.join(last_blockers)}. "
                     
-                    return response + "Ready for personalized stand-up."
+                    response += "Ready for personalized stand-up."
                 else:
-                    return f"New team member {participant_name}. No previous history found."
+                    response = f"New team member {participant_name}. No previous history found."
+                
+                self._lookup_responses[participant_name] = response
+                return response
             else:
                 return f"Database unavailable. Proceeding with {participant_name}."
                 
@@ -459,6 +721,19 @@ Use the lookup_participant and save_session_data functions as needed.
             elif data_type == "sprintStatus":
                 self.session_data[participant_name]["sprintStatus"] = content
             
+            # Persist each answer as it arrives so a crash does not lose the meeting
+            if data_type in SESSION_FIELDS and self.mongodb and self.mongodb.is_connected():
+                previous = self._pending_writes.get(participant_name)
+                task = asyncio.create_task(
+                    self._write_session_field(previous, participant_name, data_type, content)
+                )
+                self._pending_writes[participant_name] = task
+                
+                def forget(done, name=participant_name):
+                    if self._pending_writes.get(name) is done:
+                        del self._pending_writes[name]
+                task.add_done_callback(forget)
+            
             logger.info(f"💾 Saved {data_type} for {participant_name}: {content}")
             return f"Got it, I've recorded that information."
             
@@ -466,22 +741,20 @@ Use the lookup_participant and save_session_data functions as needed.
             logger.error(f"❌ Save error: {e}")
             return "Noted."
 
+    async def _write_session_field(self, previous: Optional[asyncio.Task], participant_name: str, data_type: str, content: str):
+        """Write one answer once the participant's previous write has finished"""
+        if previous is not None:
+            await asyncio.gather(previous, return_exceptions=True)
+        await self.mongodb.record_session_field(
+            participant_name, self.session_id, data_type, content
+        )
+
     async def on_enter(self):
-        """Called when agent enters room"""
+        """Called when agent enters room (the session is already running)"""
         try:
-            await asyncio.sleep(3)
-            
             # Generate meeting link automatically
             generate_meeting_link()
-            save_meeting_info()
-            
-            # Test database connection
-            if self.mongodb and self.mongodb.is_connected():
-                print("🧪 TESTING DATABASE...")
-                participants = list(self.mongodb.participants_collection.find({}, {"name": 1, "project": 1}))
-                print(f"📋 DATABASE TEST: Found {len(participants)} participants")
-                for p in participants:
-                    print(f"   - {p.get('name')} ({p.get('project', 'No project')})")
+            await save_meeting_info()
             
             welcome_msg = """
 Good morning! I'm NEHA, your AI Scrum Master, and I'm ready to facilitate today's daily stand-up meeting.
@@ -505,7 +778,7 @@ Waiting for team members to join the stand-up...
             if participant_identity == "neha-agent":
                 return
             
-            print(f"\n🚀 PARTICIPANT JOINED: '{participant_identity}'")
+            logger.debug("🚀 Participant joined identity=%r", participant_identity)
             
             # Look them up in database
             await self.lookup_participant(participant_identity)
@@ -520,12 +793,11 @@ Waiting for team members to join the stand-up...
             else:
                 welcome_msg = f"Welcome {participant_identity}! I don't see you in our team database yet, but let's proceed with the stand-up. What did you work on yesterday?"
             
-            # Send personalized welcome
-            await asyncio.sleep(1)
+            # Send personalized welcome as soon as the lookup returns
             await self.session.say(welcome_msg)
             
         except Exception as e:
-            print(f"❌ Error handling participant: {e}")
+            logger.error(f"❌ Error handling participant: {e}")
 
     async def on_exit(self):
         """Save all session data when exiting"""
@@ -534,28 +806,40 @@ Waiting for team members to join the stand-up...
             MEETING_STATUS = "inactive"
             
             if self.mongodb and self.mongodb.is_connected():
-                for participant_name, data in self.session_data.items():
-                    success = self.mongodb.update_participant_data(participant_name, data)
-                    if success:
-                        logger.info(f"✅ Saved session data for {participant_name}")
-                    else:
-                        logger.warning(f"❌ Failed to save data for {participant_name}")
+                # Let incremental writes land first so none re-creates currentSession
+                if self._pending_writes:
+                    await asyncio.gather(*self._pending_writes.values(), return_exceptions=True)
+                # The in-memory answers are complete, including any write that failed
+                success = await self.mongodb.bulk_update(
+                    list(self.session_data.items()), self.session_id
+                )
+                if success:
+                    logger.info(f"✅ Saved session data for {len(self.session_data)} participants")
+                else:
+                    logger.warning("❌ Failed to save session data")
         except Exception as e:
             logger.error(f"❌ Exit error: {e}")
 
 
 async def entrypoint(ctx: JobContext):
     """Main entrypoint"""
+    from livekit.plugins import noise_cancellation
+    from livekit.plugins.turn_detector.multilingual import MultilingualModel
+    
     try:
         logger.info("🚀 Starting NEHA AI agent...")
         
         await ctx.connect(auto_subscribe=agents.AutoSubscribe.SUBSCRIBE_ALL)
         logger.info("🔗 Connected to LiveKit room")
 
+        # Health-check the async Mongo client on the job's own event loop
+        get_mongodb().start_health_check()
+
         # Get prewarmed components
         vad = ctx.proc.userdata["vad"]
         stt = ctx.proc.userdata["stt"]
         tts = ctx.proc.userdata["tts"]
+        llm = ctx.proc.userdata["llm"]
 
         # Create agent
         agent = NEHAAIAgent(ctx)
@@ -563,7 +847,7 @@ async def entrypoint(ctx: JobContext):
         # Create and start session
         session = AgentSession(
             stt=stt,
-            llm=openai.LLM(model="gpt-4o-mini"),
+            llm=llm,
             tts=tts,
             vad=vad,
             turn_detection=MultilingualModel(),
@@ -584,7 +868,7 @@ async def entrypoint(ctx: JobContext):
 
         def on_participant_disconnected(participant: rtc.RemoteParticipant):
             """Callback for when participant disconnects"""
-            print(f"👋 PARTICIPANT LEFT: '{participant.identity}'")
+            logger.debug("👋 Participant left identity=%r", participant.identity)
 
         # Set up event callbacks
         ctx.room.on("participant_connected", on_participant_connected)
@@ -596,13 +880,14 @@ async def entrypoint(ctx: JobContext):
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"./transcript_{ROOM_NAME}_{timestamp}.json"
                 
-                with open(filename, 'w') as f:
-                    json.dump(session.history.to_dict(), f, indent=2)
+                await write_json_file(filename, session.history.to_dict())
                 logger.info(f"💾 Transcript saved: {filename}")
                 
                 await agent.on_exit()
             except Exception as e:
                 logger.error(f"❌ Save transcript error: {e}")
+            finally:
+                await release_mongodb()
 
         ctx.add_shutdown_callback(save_transcript)
         logger.info("✅ NEHA AI agent setup complete")
@@ -622,10 +907,15 @@ if __name__ == "__main__":
         print("🌐 API server will start on port 5000")
         print("="*60)
         
-        # Start Flask server in background
-        flask_thread = threading.Thread(target=start_flask_server, daemon=True)
-        flask_thread.start()
-        logger.info("🌐 Flask API server started")
+        # Plugins register themselves on import and must do so on the main
+        # thread, before the CLI (e.g. `download-files`) looks them up
+        from livekit.plugins import openai, silero, noise_cancellation  # noqa: F401
+        from livekit.plugins.turn_detector.multilingual import MultilingualModel  # noqa: F401
+        
+        # The worker's main loop is owned by cli.run_app, so the API gets its own
+        api_thread = threading.Thread(target=start_api_server, daemon=True)
+        api_thread.start()
+        logger.info("🌐 Quart API server started")
         
         # Start LiveKit agent
         opts = WorkerOptions(